@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 
 from glowmarkt import BrightClient
 import requests
@@ -11,64 +13,131 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-
-from .const import CONF_DAILY_INTERVAL, CONF_TARIFF_INTERVAL, DOMAIN
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .api import GlowmarktApi, authenticate
+from .circuit import CircuitOpenError
+from .const import (
+    AUTH_CACHE,
+    AUTH_CACHE_TTL,
+    CONF_DAILY_INTERVAL,
+    CONF_TARIFF_INTERVAL,
+    DAILY_STORE_KEY,
+    DAILY_STORE_VERSION,
+    DEFAULT_DAILY_INTERVAL,
+    DEFAULT_TARIFF_INTERVAL,
+    DOMAIN,
+    TARIFF_STORE_KEY,
+    TARIFF_STORE_VERSION,
+)
+from .models import GlowRuntime
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: tuple[Platform, ...] = (Platform.SENSOR,)
+
+AUTH_TIMEOUT = 15  # seconds
+
+# Authenticate one entry at a time so concurrent setups at startup don't tie up
+# several executor threads on blocking logins
+_AUTH_LOCK = asyncio.Lock()
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Hildebrand Glow (DCC) from a config entry."""
-    _LOGGER.debug("Starting async_setup_entry for %s", DOMAIN)
+    # Skip formatting the setup chatter below unless debug logging is on
+    _debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    if _debug:
+        _LOGGER.debug("Starting async_setup_entry for %s", DOMAIN)
     hass.data.setdefault(DOMAIN, {})
-    # Authenticate with the API
-    try:
-        _LOGGER.debug("Authenticating with Glowmarkt API...")
-        glowmarkt = await hass.async_add_executor_job(
-            BrightClient, entry.data["username"], entry.data["password"]
-        )
-    except requests.exceptions.HTTPError as ex:
-        _LOGGER.error(
-            "HTTP error during API authentication: Status Code %s - %s",
-            ex.response.status_code,
-            ex,
-        )
-        raise ConfigEntryNotReady(f"HTTP Error: {ex.response.status_code}") from ex
-    except requests.Timeout as ex:
-        _LOGGER.error("Timeout during API authentication: %s", ex)
-        raise ConfigEntryNotReady(f"Timeout: {ex}") from ex
-    except requests.exceptions.ConnectionError as ex:
-        _LOGGER.error("Connection error during API authentication: %s", ex)
-        raise ConfigEntryNotReady(f"Cannot connect: {ex}") from ex
-    except Exception as ex:  # pylint: disable=broad-except
-        _LOGGER.exception("Unexpected exception during API authentication: %s", ex)
-        raise ConfigEntryNotReady(f"Unexpected exception: {ex}") from ex
+    username, password = entry.data["username"], entry.data["password"]
+    # Reuse the client authenticated by the config flow, if it is still fresh
+    glowmarkt = _pop_cached_client(hass, username)
+    if glowmarkt is not None:
+        if _debug:
+            _LOGGER.debug("Reusing API object authenticated by the config flow.")
     else:
-        _LOGGER.debug("Successful authentication. API object created.")
-
-    # Set API object and config options, using options flow values if they exist
-    hass.data[DOMAIN][entry.entry_id] = {
-        "client": glowmarkt,
-        CONF_DAILY_INTERVAL: entry.options.get(
-            CONF_DAILY_INTERVAL, entry.data.get(CONF_DAILY_INTERVAL, 15)
+        # Authenticate with the API
+        try:
+            if _debug:
+                _LOGGER.debug("Authenticating with Glowmarkt API...")
+            async with _AUTH_LOCK, asyncio.timeout(AUTH_TIMEOUT):
+                glowmarkt = await hass.async_add_executor_job(
+                    authenticate, username, password
+                )
+        except TimeoutError as ex:
+            _LOGGER.error(
+                "API authentication did not finish within %s seconds", AUTH_TIMEOUT
+            )
+            raise ConfigEntryNotReady("Timeout authenticating with the API") from ex
+        except CircuitOpenError as ex:
+            _LOGGER.warning("Skipping API authentication: %s", ex)
+            raise ConfigEntryNotReady("circuit open") from ex
+        except requests.exceptions.HTTPError as ex:
+            _LOGGER.error(
+                "HTTP error during API authentication: Status Code %s - %s",
+                ex.response.status_code,
+                ex,
+            )
+            raise ConfigEntryNotReady(f"HTTP Error: {ex.response.status_code}") from ex
+        except requests.Timeout as ex:
+            _LOGGER.error("Timeout during API authentication: %s", ex)
+            raise ConfigEntryNotReady(f"Timeout: {ex}") from ex
+        except requests.exceptions.ConnectionError as ex:
+            _LOGGER.error("Connection error during API authentication: %s", ex)
+            raise ConfigEntryNotReady(f"Cannot connect: {ex}") from ex
+        except (requests.RequestException, RuntimeError) as ex:
+            # glowmarkt raises RuntimeError when the API rejects the login
+            _LOGGER.error("API authentication failed: %s", ex)
+            raise ConfigEntryNotReady(f"Authentication failed: {ex}") from ex
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.error("Unexpected exception during API authentication: %s", ex)
+            _LOGGER.debug("Traceback", exc_info=True)
+            raise ConfigEntryNotReady(f"Unexpected exception: {ex}") from ex
+        else:
+            if _debug:
+                _LOGGER.debug("Successful authentication. API object created.")
+
+    # Set API object and config options, using options flow values if they exist.
+    # BrightClient is only used to log in; all polling goes through GlowmarktApi
+    # on Home Assistant's shared aiohttp session
+    hass.data[DOMAIN][entry.entry_id] = GlowRuntime(
+        client=glowmarkt,
+        api=GlowmarktApi(async_get_clientsession(hass), glowmarkt),
+        daily_interval=entry.options.get(
+            CONF_DAILY_INTERVAL,
+            entry.data.get(CONF_DAILY_INTERVAL, DEFAULT_DAILY_INTERVAL),
         ),
-        CONF_TARIFF_INTERVAL: entry.options.get(
-            CONF_TARIFF_INTERVAL, entry.data.get(CONF_TARIFF_INTERVAL, 60)
+        tariff_interval=entry.options.get(
+            CONF_TARIFF_INTERVAL,
+            entry.data.get(CONF_TARIFF_INTERVAL, DEFAULT_TARIFF_INTERVAL),
         ),
-    }
-    _LOGGER.debug(
-        "API object and config stored in hass.data. Forwarding setup to platforms..."
     )
+    if _debug:
+        _LOGGER.debug(
+            "API object and config stored in hass.data. Forwarding setup to platforms..."
+        )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
-    _LOGGER.debug("Finished async_setup_entry successfully.")
+    if _debug:
+        _LOGGER.debug("Finished async_setup_entry successfully.")
     return True
 
 
+def _pop_cached_client(hass: HomeAssistant, username: str) -> BrightClient | None:
+    """Return the client cached by the config flow for username, if still fresh."""
+    cached = hass.data[DOMAIN].get(AUTH_CACHE, {}).pop(username, None)
+    if cached is None:
+        return None
+    created, glowmarkt = cached
+    if time.monotonic() - created > AUTH_CACHE_TTL:
+        return None
+    return glowmarkt
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Starting async_unload_entry for %s", DOMAIN)
@@ -78,6 +147,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data saved to disk for a config entry."""
+    await asyncio.gather(
+        *(
+            Store(hass, version, f"{key}.{entry.entry_id}").async_remove()
+            for key, version in (
+                (DAILY_STORE_KEY, DAILY_STORE_VERSION),
+                (TARIFF_STORE_KEY, TARIFF_STORE_VERSION),
+            )
+        )
+    )
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
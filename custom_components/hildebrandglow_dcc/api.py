@@ -0,0 +1,235 @@
+"""Helpers for talking to the Glowmarkt API."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+import logging
+import random
+import time
+from typing import Any
+
+import aiohttp
+from glowmarkt import (
+    KWH,
+    BrightClient,
+    Pence,
+    Rate,
+    Resource,
+    Tariff,
+    Unknown,
+    VirtualEntity,
+)
+import requests
+
+from .circuit import get_breaker
+
+_LOGGER = logging.getLogger(__name__)
+
+API_HOST = "api.glowmarkt.com"
+AUTH_ATTEMPTS = 3
+AUTH_BACKOFF = 0.5  # seconds
+MAX_PARALLEL_REQUESTS = 2
+REQUEST_ATTEMPTS = 3
+REQUEST_BACKOFF = 0.5  # seconds
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+# Gateway errors the API returns while it is briefly overloaded, worth retrying
+RETRY_STATUSES = (502, 503, 504)
+
+_UNITS = {"pence": Pence, "kWh": KWH}
+
+# Failures where the API never answered, worth retrying
+TRANSIENT_ERRORS = (requests.Timeout, requests.exceptions.ConnectionError)
+# Failures the config flow reports as a failed login; glowmarkt raises
+# RuntimeError when the API rejects the credentials
+AUTH_ERRORS = (RuntimeError,)
+
+_BREAKER = get_breaker(API_HOST)
+# Shared by every config entry, so refreshes that start together queue up
+# instead of hitting the API all at once
+_REQUEST_SEMAPHORE = asyncio.Semaphore(MAX_PARALLEL_REQUESTS)
+
+
+def authenticate(username: str, password: str) -> BrightClient:
+    """Authenticate with the API, retrying transient failures.
+
+    Timeouts and connection errors are retried with exponential backoff and full
+    jitter; anything else, including rejected credentials, is raised straight
+    away. Every attempt goes through the API host's circuit breaker, so this
+    raises CircuitOpenError without touching the network while the API is down.
+    This blocks, so it must be run in the executor.
+    """
+    attempt = 0
+    while True:
+        try:
+            return _BREAKER.call(BrightClient, username, password)
+        except TRANSIENT_ERRORS as ex:
+            attempt += 1
+            if attempt >= AUTH_ATTEMPTS:
+                raise
+            delay = random.uniform(0, AUTH_BACKOFF * 2 ** (attempt - 1))
+            _LOGGER.debug(
+                "Authentication attempt %s failed: %s. Retrying in %.2f seconds",
+                attempt,
+                ex,
+                delay,
+            )
+            time.sleep(delay)
+
+
+class GlowmarktApi:
+    """Async access to the Glowmarkt API endpoints polled by the sensors.
+
+    Logging in stays with the blocking BrightClient, run in the executor. The
+    polling calls reuse its token over Home Assistant's shared aiohttp session,
+    so they don't hold an executor thread for the length of each request. The
+    objects returned are the same glowmarkt types BrightClient would build.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, client: BrightClient) -> None:
+        """Initialize the API wrapper."""
+        self._session = session
+        self.client = client
+        self.url = client.url
+
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """GET path from the API and return the decoded JSON body.
+
+        Gateway errors are retried with exponential backoff, up to
+        REQUEST_ATTEMPTS attempts in all. At most MAX_PARALLEL_REQUESTS requests
+        are in flight at a time; the backoff sleeps don't hold a slot.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "applicationId": self.client.application,
+            "token": self.client.token,
+        }
+        for attempt in range(1, REQUEST_ATTEMPTS + 1):
+            async with _REQUEST_SEMAPHORE, self._session.get(
+                f"{self.url}{path}",
+                headers=headers,
+                params=params,
+                timeout=REQUEST_TIMEOUT,
+            ) as resp:
+                if resp.status not in RETRY_STATUSES or attempt == REQUEST_ATTEMPTS:
+                    resp.raise_for_status()
+                    return await resp.json(content_type=None)
+            delay = REQUEST_BACKOFF * 2 ** (attempt - 1)
+            _LOGGER.debug(
+                "GET %s returned %s. Retrying in %.2f seconds",
+                path,
+                resp.status,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def async_get_virtual_entities(self) -> list[VirtualEntity]:
+        """Return the virtual entities on the account."""
+        ves = []
+        for elt in await self._get("virtualentity"):
+            ve = VirtualEntity()
+            ve.client = self.client
+            ve.application = elt["applicationId"]
+            ve.type_id = elt["veTypeId"]
+            ve.id = elt["veId"]
+            ve.postal_code = elt.get("postalCode")
+            ve.name = elt.get("name")
+            ves.append(ve)
+        return ves
+
+    async def async_get_resources(self, ve_id: str) -> list[Resource]:
+        """Return the resources of a virtual entity."""
+        resp = await self._get(f"virtualentity/{ve_id}/resources")
+        resources = []
+        for elt in resp["resources"]:
+            r = Resource()
+            r.client = self.client
+            r.id = elt["resourceId"]
+            r.type_id = elt["resourceTypeId"]
+            r.name = elt["name"]
+            r.classifier = elt["classifier"]
+            r.description = elt["description"]
+            r.base_unit = elt["baseUnit"]
+            resources.append(r)
+        return resources
+
+    async def async_catchup(self, resource_id: str) -> Any:
+        """Ask the API to pull the latest readings for a resource from the DCC."""
+        return await self._get(f"resource/{resource_id}/catchup")
+
+    async def async_get_readings(
+        self,
+        resource_id: str,
+        t_from: datetime,
+        t_to: datetime,
+        period: str,
+        *,
+        func: str = "sum",
+        nulls: bool = False,
+    ) -> list[list]:
+        """Return [timestamp, value] readings for a resource."""
+        params = {
+            "from": _time_string(t_from),
+            "to": _time_string(t_to),
+            "period": period,
+            # Times are converted to UTC here, so keep the server side in UTC
+            "offset": 0,
+            "function": func,
+            "nulls": 1 if nulls else 0,
+        }
+        resp = await self._get(f"resource/{resource_id}/readings", params)
+        cls = _UNITS.get(resp["units"], Unknown)
+        return [
+            [datetime.fromtimestamp(v[0], tz=UTC).astimezone(), cls(v[1])]
+            for v in resp["data"]
+            if v[1] is not None
+        ]
+
+    async def async_get_tariff(self, resource_id: str) -> Tariff | None:
+        """Return the current tariff of a resource, or None if it has none."""
+        resp = await self._get(f"resource/{resource_id}/tariff")
+        if not resp["data"]:
+            return None
+        elt = resp["data"][-1]
+        return tariff_from_dict(
+            {
+                "name": elt["name"],
+                "commodity": elt["commodity"],
+                "cid": elt["cid"],
+                "type": elt["type"],
+                "rate": elt["currentRates"]["rate"],
+                "standing_charge": elt["currentRates"]["standingCharge"],
+            }
+        )
+
+
+def tariff_to_dict(tariff: Tariff) -> dict[str, Any]:
+    """Return a tariff as a JSON serializable dict."""
+    return {
+        "name": tariff.name,
+        "commodity": tariff.commodity,
+        "cid": tariff.cid,
+        "type": tariff.type,
+        "rate": tariff.current_rates.rate.value,
+        "standing_charge": tariff.current_rates.standing_charge.value,
+    }
+
+
+def tariff_from_dict(data: dict[str, Any]) -> Tariff:
+    """Return the tariff described by a dict from tariff_to_dict."""
+    tariff = Tariff()
+    tariff.name = data["name"]
+    tariff.commodity = data["commodity"]
+    tariff.cid = data["cid"]
+    tariff.type = data["type"]
+    rate = Rate()
+    rate.rate = Pence(data["rate"])
+    rate.standing_charge = Pence(data["standing_charge"])
+    rate.tier = None
+    tariff.current_rates = rate
+    return tariff
+
+
+def _time_string(when: datetime) -> str:
+    """Return when as the naive UTC ISO string the readings endpoint expects."""
+    return when.astimezone(UTC).replace(tzinfo=None).isoformat()
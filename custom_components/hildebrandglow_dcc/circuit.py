@@ -0,0 +1,127 @@
+"""Circuit breaker for calls to the Glowmarkt API."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import logging
+import threading
+import time
+from typing import Any, TypeVar
+
+import requests
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the circuit is open."""
+
+
+def _is_failure(ex: Exception) -> bool:
+    """Return True if the exception means the API host is unhealthy.
+
+    glowmarkt turns every non-200 login response into a RuntimeError without
+    the status code, so only failures to reach the host are counted.
+    """
+    return isinstance(ex, (requests.Timeout, requests.exceptions.ConnectionError))
+
+
+class CircuitBreaker:
+    """Short-circuit calls to a host after repeated failures.
+
+    The circuit opens once `threshold` failures have been seen within `window`
+    seconds. While open every call fails fast with CircuitOpenError; after
+    `reset_timeout` seconds a single probe call is let through (half open), and
+    its outcome decides whether the circuit closes or opens again. A probe that
+    has not returned within `reset_timeout` seconds is given up on, and the next
+    call becomes the probe instead.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: int = 5,
+        window: float = 60,
+        reset_timeout: float = 30,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self.name = name
+        self.threshold = threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self._failures: deque[float] = deque()
+        self._opened_at = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    def call(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Call fn through the breaker. Blocking, like fn itself."""
+        self._before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as ex:
+            self._after_call(_is_failure(ex))
+            raise
+        self._after_call(False)
+        return result
+
+    def _before_call(self) -> None:
+        """Refuse the call if the circuit is open or a probe is in flight."""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN:
+                if now - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"Circuit open for {self.name}")
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == HALF_OPEN:
+                # The blocking call can't be cancelled, so a hung probe would
+                # otherwise keep the circuit half open for good
+                if self._probing and now - self._probe_started < self.reset_timeout:
+                    raise CircuitOpenError(f"Circuit half open for {self.name}")
+                self._probing = True
+                self._probe_started = now
+
+    def _after_call(self, failed: bool) -> None:
+        """Record the outcome of a call and update the circuit state."""
+        with self._lock:
+            now = time.monotonic()
+            if not failed:
+                if self.state != CLOSED:
+                    _LOGGER.info("Circuit for %s closed", self.name)
+                self.state = CLOSED
+                self._probing = False
+                self._failures.clear()
+                return
+
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window:
+                self._failures.popleft()
+            if self.state == HALF_OPEN or len(self._failures) >= self.threshold:
+                _LOGGER.warning(
+                    "Circuit for %s opened for %s seconds after repeated failures",
+                    self.name,
+                    self.reset_timeout,
+                )
+                self.state = OPEN
+                self._opened_at = now
+                self._probing = False
+
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """Return the shared circuit breaker for host."""
+    if (breaker := _BREAKERS.get(host)) is None:
+        breaker = _BREAKERS[host] = CircuitBreaker(host)
+    return breaker
@@ -3,37 +3,26 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
-from glowmarkt import BrightClient
 import requests
-import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import CONF_DAILY_INTERVAL, CONF_TARIFF_INTERVAL, DOMAIN
-
-_LOGGER = logging.getLogger(__name__)
-
-STEP_USER_DATA_SCHEMA = vol.Schema(
-    {
-        vol.Required("username"): str,
-        vol.Required("password"): str,
-    }
+from .api import AUTH_ERRORS, authenticate
+from .circuit import CircuitOpenError
+from .const import (
+    AUTH_CACHE,
+    DEFAULT_OPTIONS,
+    DOMAIN,
+    OPTIONS_SCHEMA,
+    STEP_USER_DATA_SCHEMA,
 )
 
-OPTIONS_SCHEMA = vol.Schema(
-    {
-        vol.Optional(CONF_DAILY_INTERVAL): vol.All(
-            vol.Coerce(int), vol.Range(min=1)
-        ),
-        vol.Optional(CONF_TARIFF_INTERVAL): vol.All(
-            vol.Coerce(int), vol.Range(min=1)
-        ),
-    }
-)
+_LOGGER = logging.getLogger(__name__)
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
@@ -41,16 +30,22 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
+    username, password = data["username"], data["password"]
     try:
-        glowmarkt = await hass.async_add_executor_job(
-            BrightClient, data["username"], data["password"]
-        )
-    except (requests.Timeout, requests.exceptions.ConnectionError, ValueError) as ex:
+        glowmarkt = await hass.async_add_executor_job(authenticate, username, password)
+    except AUTH_ERRORS as ex:
         _LOGGER.error("Authentication failed: %s", ex)
         raise ValueError("Authentication failed") from ex
 
     _LOGGER.debug("Successful Post to %sauth", glowmarkt.url)
 
+    # Keep the authenticated client so async_setup_entry can reuse it rather
+    # than logging in a second time when the entry is created
+    hass.data.setdefault(DOMAIN, {}).setdefault(AUTH_CACHE, {})[username] = (
+        time.monotonic(),
+        glowmarkt,
+    )
+
     # Return title of the entry to be added
     return {"title": "Hildebrand Glow (DCC)"}
 
@@ -73,6 +68,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         try:
             info = await validate_input(self.hass, user_input)
+        except CircuitOpenError as ex:
+            _LOGGER.debug("Cannot connect: %s", ex)
+            errors["base"] = "cannot_connect"
         except requests.Timeout as ex:
             _LOGGER.debug("Timeout: %s", ex)
             errors["base"] = "timeout_connect"
@@ -82,11 +80,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         except ValueError:
             _LOGGER.debug("Authentication Failed")
             errors["base"] = "invalid_auth"
-        except Exception as ex:
-            _LOGGER.exception("Unexpected exception: %s", ex)
+        except requests.RequestException as ex:
+            _LOGGER.debug("Cannot connect: %s", ex)
+            errors["base"] = "cannot_connect"
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.error("Unexpected exception: %s", ex)
+            _LOGGER.debug("Traceback", exc_info=True)
             errors["base"] = "unknown"
         else:
-            return self.async_create_entry(title=info["title"], data=user_input, options={CONF_DAILY_INTERVAL: 15, CONF_TARIFF_INTERVAL: 60})
+            return self.async_create_entry(
+                title=info["title"], data=user_input, options=dict(DEFAULT_OPTIONS)
+            )
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
@@ -105,26 +109,19 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     
     async def async_migrate_entry(self, config_entry: config_entries.ConfigEntry):
         """Migrate old entry."""
-        _LOGGER.debug("Migrating from version %s", config_entry.version)
-
-        # In this simple case, we are just bumping the version and the data structure has not changed - with the exception of version 1.1.5 and 1.1.6 preview, which 
-        # introduced the polling frequency values - which were then remove, and added as options in the Options workflow handler.... 
-        # However v1.3.0 bumped the version config_flow number to 6, so we need to maintain that number or higher going forwards.
-        # Home Assistant requires this method to exist to prevent a migration error when the version number changes.
-        
-        # When moving from a new version to an old one, the existing entry's data is
-        # incompatible. To handle a downgrade, you would need to add logic here to
-        # transform the new data back to the old format.
-        # Example:
-        # if config_entry.version == 2:
-        #     new_data = {**config_entry.data}
-        #     # Add new logic here to transform the data.
-        #     config_entry.version = 1
-        #     self.hass.config_entries.async_update_entry(config_entry, data=new_data)
-        
-        # For a simple version bump with no data change, just return True.
-        
-        _LOGGER.info("Migration successful for config entry version %s", config_entry.version)
+        if config_entry.version == self.VERSION:
+            return True
+
+        # The data structure has not changed between versions - with the exception
+        # of the 1.1.5 and 1.1.6 previews, which introduced the polling frequency
+        # values that were later moved to the options flow. v1.3.0 bumped the
+        # config flow version to 6, so we need to keep that number or higher going
+        # forwards. To handle a downgrade, logic to transform the data back to the
+        # old format would have to be added here.
+        _LOGGER.warning(
+            "Unknown config entry version %s, leaving entry untouched",
+            config_entry.version,
+        )
         return True
 
 
@@ -133,24 +130,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     
     async def async_step_init(self, user_input=None):
         """Handle the options flow."""
-        errors = {}
-
         if user_input is not None:
-            daily_interval = user_input.get(CONF_DAILY_INTERVAL)
-            tariff_interval = user_input.get(CONF_TARIFF_INTERVAL)
-            
-            daily_interval = int(daily_interval) if daily_interval is not None else 1
-            tariff_interval = int(tariff_interval) if tariff_interval is not None else 1
-
-            if daily_interval < 5 or tariff_interval < 5:
-                errors["base"] = "Intervals of less than 5 minutes are not allowed to protect the Hildebrand Glow API from being overloaded."
-            
-            if not errors:
-                return self.async_create_entry(data=user_input)
-
-        data_schema = self.add_suggested_values_to_schema(
-            OPTIONS_SCHEMA,
-            self.config_entry.options,
-        )
+            # OPTIONS_SCHEMA has already rejected intervals of less than 5 minutes
+            return self.async_create_entry(data=user_input)
 
-        return self.async_show_form(step_id="init", data_schema=data_schema, errors=errors)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA,
+                self.config_entry.options,
+            ),
+        )
@@ -1,5 +1,9 @@
 """Constants for the Hildebrand Glow (DCC) integration."""
 
+from types import MappingProxyType
+
+import voluptuous as vol
+
 DOMAIN = "hildebrandglow_dcc"
 
 # Virtual Entity Classifiers
@@ -12,6 +16,57 @@ GAS_COST_CLASSIFIER = "gas.consumption.cost"
 ELECTRIC_METER = "electric_meter"
 GAS_METER = "gas_meter"
 
-# ADD THESE LINES
+# Options
 CONF_DAILY_INTERVAL = "daily_interval"
 CONF_TARIFF_INTERVAL = "tariff_interval"
+
+DEFAULT_DAILY_INTERVAL = 15  # minutes
+DEFAULT_TARIFF_INTERVAL = 60  # minutes
+DEFAULT_OPTIONS = MappingProxyType(
+    {
+        CONF_DAILY_INTERVAL: DEFAULT_DAILY_INTERVAL,
+        CONF_TARIFF_INTERVAL: DEFAULT_TARIFF_INTERVAL,
+    }
+)
+
+# Shortest time between asking the API to pull new readings from the DCC
+CATCHUP_INTERVAL = 30  # minutes
+
+# Today's totals, kept across restarts so sensors start with a value
+DAILY_STORE_KEY = f"{DOMAIN}.daily"
+DAILY_STORE_VERSION = 1
+DAILY_SAVE_DELAY = 10  # seconds
+
+# Last tariffs fetched, kept across restarts to fall back on
+TARIFF_STORE_KEY = f"{DOMAIN}.tariff"
+TARIFF_STORE_VERSION = 1
+TARIFF_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+# How long a resource found to have no tariff is left before asking again
+NO_TARIFF_RECHECK = 24  # hours
+
+# Clients authenticated by the config flow, handed over to async_setup_entry
+AUTH_CACHE = "_auth_cache"
+AUTH_CACHE_TTL = 120  # seconds
+
+# Config and options flow schemas, built once at import
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("username"): str,
+        vol.Required("password"): str,
+    }
+)
+
+_INTERVAL = vol.All(
+    vol.Coerce(int),
+    vol.Range(
+        min=5,
+        msg="Intervals of less than 5 minutes are not allowed to protect the Hildebrand Glow API from being overloaded.",
+    ),
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_DAILY_INTERVAL): _INTERVAL,
+        vol.Optional(CONF_TARIFF_INTERVAL): _INTERVAL,
+    }
+)
@@ -0,0 +1,21 @@
+"""Runtime data for the Hildebrand Glow (DCC) integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from glowmarkt import BrightClient
+
+    from .api import GlowmarktApi
+
+
+@dataclass(slots=True, frozen=True)
+class GlowRuntime:
+    """API client and polling intervals for a config entry."""
+
+    client: BrightClient
+    api: GlowmarktApi
+    daily_interval: int
+    tariff_interval: int
@@ -5,11 +5,13 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import asyncio
 from collections.abc import Callable
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, timedelta, tzinfo
+from decimal import Decimal
+from functools import lru_cache
 import logging
+import math
 
-import requests
-from requests.exceptions import ConnectionError, HTTPError, Timeout
+from aiohttp import ClientError, ClientResponseError
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -20,6 +22,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfEnergy
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -27,102 +30,320 @@ from homeassistant.helpers.update_coordinator import (
 )
 from homeassistant.util import dt as dt_util
 
-from .const import CONF_DAILY_INTERVAL, CONF_TARIFF_INTERVAL, DOMAIN
+from .api import GlowmarktApi, tariff_from_dict, tariff_to_dict
+from .const import (
+    CATCHUP_INTERVAL,
+    DAILY_SAVE_DELAY,
+    DAILY_STORE_KEY,
+    DAILY_STORE_VERSION,
+    DOMAIN,
+    ELEC_CONSUMPTION_CLASSIFIER,
+    ELEC_COST_CLASSIFIER,
+    GAS_CONSUMPTION_CLASSIFIER,
+    GAS_COST_CLASSIFIER,
+    NO_TARIFF_RECHECK,
+    TARIFF_CACHE_MAX_AGE,
+    TARIFF_STORE_KEY,
+    TARIFF_STORE_VERSION,
+)
+from .models import GlowRuntime
 
 _LOGGER = logging.getLogger(__name__)
 
+# Refresh start times drift by a second or so, which can leave two refreshes a
+# fraction short of CATCHUP_INTERVAL apart; allow a minute's margin
+_CATCHUP_DUE = timedelta(minutes=CATCHUP_INTERVAL - 1)
+
 # --- COORDINATOR CLASSES ---
 
 
 class DataCoordinator(DataUpdateCoordinator):
-    """Data update coordinator for daily usage and cost sensors."""
+    """Data update coordinator for daily usage and cost sensors.
 
-    def __init__(self, hass: HomeAssistant, glowmarkt_resource, daily_interval):
+    One coordinator polls every daily resource on the account, and its data maps
+    each resource id to today's total, or None if that resource has no total yet
+    today. The totals are saved to disk, so after a restart on the same day the
+    sensors start out with them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: GlowmarktApi,
+        resources: list,
+        daily_interval,
+        entry_id: str,
+    ):
         """Initialize daily data coordinator."""
-        self.resource = glowmarkt_resource
+        self.api = api
+        self.resources = resources
+        self._store = Store(hass, DAILY_STORE_VERSION, f"{DAILY_STORE_KEY}.{entry_id}")
+        self._day: str | None = None
+        self._last_catchup: datetime | None = None
         super().__init__(
             hass,
             _LOGGER,
-            name=f"Daily Data {glowmarkt_resource.classifier}",
+            name="Daily Data",
             update_interval=timedelta(minutes=daily_interval),
         )
 
+    async def async_load_cache(self) -> None:
+        """Seed the data with the totals saved earlier today, if any."""
+        cached = await self._store.async_load()
+        if not cached or cached["day"] != dt_util.now().date().isoformat():
+            return
+        self.data = cached["values"]
+        self._day = cached["day"]
+        _LOGGER.debug("Loaded cached daily totals for %s", self._day)
+
+    @callback
+    def _data_to_store(self) -> dict:
+        """Return the totals to save to disk."""
+        return {"day": self._day, "values": self.data}
+
+    async def async_flush_cache(self) -> None:
+        """Write the totals to disk now rather than after DAILY_SAVE_DELAY.
+
+        Run on unload, so a delayed save can't land after async_remove_entry
+        has deleted the file.
+        """
+        if self.data is not None:
+            await self._store.async_save(self._data_to_store())
+
     async def _async_update_data(self):
         """Fetch data from daily usage API endpoint."""
-        _LOGGER.debug(
-            "DataCoordinator updating for resource %s", self.resource.classifier
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "DataCoordinator updating for %s resources", len(self.resources)
+            )
+        # Readings only move on once the DCC has been polled, which is slow, so
+        # catchup is asked for at most every CATCHUP_INTERVAL minutes
+        now = dt_util.utcnow()
+        catchup = self._last_catchup is None or now - self._last_catchup >= _CATCHUP_DUE
+        if catchup:
+            self._last_catchup = now
         try:
-            value = await daily_data(self.hass, self.resource)
-            # If value is None, do not raise an exception,
-            # which allows the coordinator to keep its previous state.
-            if value is None:
-                return None
-            return value
-        except HTTPError as ex:
-            raise UpdateFailed(
-                f"HTTP Error fetching daily data: {ex}, Status Code: {ex.response.status_code}"
-            ) from ex
-        except Timeout as ex:
-            raise UpdateFailed(f"Timeout fetching daily data: {ex}") from ex
-        except ConnectionError as ex:
-            raise UpdateFailed(f"Connection error fetching daily data: {ex}") from ex
+            values = await daily_data(self.api, self.resources, catchup)
         except Exception as ex:
-            _LOGGER.exception("Unexpected exception fetching daily data: %s", ex)
-            raise UpdateFailed(f"Unknown error fetching daily data: {ex}") from ex
+            raise _update_failed(ex, "daily data") from ex
+        _fetch_succeeded("daily data")
+
+        today = dt_util.now().date().isoformat()
+        if self.data and self._day == today:
+            # A resource that failed keeps the total it had earlier today
+            values = {
+                resource_id: self.data.get(resource_id) if value is None else value
+                for resource_id, value in values.items()
+            }
+        self._day = today
+        self._store.async_delay_save(self._data_to_store, DAILY_SAVE_DELAY)
+        return values
 
 
 class TariffCoordinator(DataUpdateCoordinator):
-    """Data update coordinator for the tariff sensors."""
+    """Data update coordinator for the tariff sensors.
 
-    def __init__(self, hass: HomeAssistant, resource, tariff_interval) -> None:
+    One coordinator polls the tariff of every consumption resource on the
+    account, and its data maps each resource id to its tariff, or None if the
+    resource has none. The last tariffs fetched are saved to disk; for up to
+    TARIFF_CACHE_MAX_AGE seconds after it was fetched, a tariff seeds the data
+    after a restart and stands in for a fetch of that resource that fails.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: GlowmarktApi,
+        resources: list,
+        tariff_interval,
+        entry_id: str,
+    ) -> None:
         """Initialize tariff coordinator."""
         super().__init__(
             hass,
             _LOGGER,
-            name=f"Tariff Data {resource.classifier}",
+            name="Tariff Data",
             update_interval=timedelta(minutes=tariff_interval),
         )
-        self.resource = resource
+        self.api = api
+        self.resources = resources
+        self._store = Store(
+            hass, TARIFF_STORE_VERSION, f"{TARIFF_STORE_KEY}.{entry_id}"
+        )
+        # When each resource's tariff was last fetched
+        self._fetched_at: dict[str, float] = {}
+        # What is on disk, so unchanged tariffs are not written every refresh
+        self._stored: dict | None = None
+        self._stored_at = 0.0
+
+    async def async_load_cache(self) -> None:
+        """Seed the data with the tariffs saved by a previous run, if fresh."""
+        cached = await self._store.async_load()
+        if not cached:
+            return
+        self._stored, self._stored_at = cached["tariffs"], cached["saved_at"]
+        self._fetched_at = dict(cached["fetched_at"])
+        data = {
+            resource_id: tariff_from_dict(tariff) if tariff else None
+            for resource_id, tariff in cached["tariffs"].items()
+            if self._cache_fresh(resource_id)
+        }
+        if data:
+            self.data = data
+            _LOGGER.debug("Loaded cached tariffs from %s", cached["saved_at"])
+
+    def _cache_fresh(self, resource_id: str) -> bool:
+        """Return True if the last tariff fetched for resource_id may be used."""
+        fetched_at = self._fetched_at.get(resource_id)
+        return (
+            fetched_at is not None
+            and dt_util.utcnow().timestamp() - fetched_at < TARIFF_CACHE_MAX_AGE
+        )
 
     async def _async_update_data(self):
         """Fetch data from tariff API endpoint."""
-        _LOGGER.debug(
-            "TariffCoordinator updating for resource %s", self.resource.classifier
-        )
-        try:
-            tariff = await tariff_data(self.hass, self.resource)
-            if tariff is None:
-                # If tariff_data returns None, it means no data was successfully fetched.
-                # Raise UpdateFailed to mark coordinator unavailable and propagate to sensors.
-                raise UpdateFailed(
-                    f"No tariff data received for {self.resource.classifier}"
-                )
-            return tariff
-        except HTTPError as ex:
-            _LOGGER.error(
-                "HTTP Error fetching tariff data for %s: %s, Status Code: %s",
-                self.resource.classifier,
-                ex,
-                ex.response.status_code,
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "TariffCoordinator updating for %s resources", len(self.resources)
             )
-            raise UpdateFailed(f"Failed to fetch tariff data: {ex}") from ex
-        except Exception as ex:
-            _LOGGER.exception(
-                "Error fetching tariff data for %s: %s", self.resource.classifier, ex
+        results = await asyncio.gather(
+            *(tariff_data(self.api, r) for r in self.resources),
+            return_exceptions=True,
+        )
+        now = dt_util.utcnow().timestamp()
+        previous = self.data or {}
+        data = {}
+        stored = dict(self._stored or {})
+        for resource, result in zip(self.resources, results):
+            if isinstance(result, BaseException):
+                # A failed fetch keeps the last tariff while it is fresh, and
+                # leaves the saved one as it was
+                tariff = None
+                if self._cache_fresh(resource.id):
+                    tariff = previous.get(resource.id)
+                if tariff is not None:
+                    _LOGGER.warning(
+                        "Using cached tariff for %s, fetching failed",
+                        resource.classifier,
+                    )
+                data[resource.id] = tariff
+                continue
+            data[resource.id] = result
+            stored[resource.id] = tariff_to_dict(result) if result else None
+            self._fetched_at[resource.id] = now
+        if all(tariff is None for tariff in data.values()):
+            # No tariff was fetched at all. Raise UpdateFailed to mark the
+            # coordinator unavailable for the sensors.
+            raise UpdateFailed("No tariff data received")
+
+        # Write only when the tariffs change, or when the copy on disk is half
+        # way to being too old to load after a restart
+        if stored != self._stored or now - self._stored_at >= TARIFF_CACHE_MAX_AGE / 2:
+            self._stored, self._stored_at = stored, now
+            await self._store.async_save(
+                {
+                    "saved_at": now,
+                    "tariffs": stored,
+                    "fetched_at": dict(self._fetched_at),
+                }
             )
-            raise UpdateFailed(f"Failed to fetch tariff data: {ex}") from ex
+        return data
 
 
 # --- HELPER FUNCTIONS ---
 
+# Expected API failures and how they are reported, most specific first
+_EXC_MAP = {
+    ClientResponseError: "HTTP error",
+    TimeoutError: "Timeout",
+    ClientError: "Connection error",
+}
+
+
+def _error_reason(ex: Exception) -> str | None:
+    """Return the reason for an expected API failure, or None if unexpected."""
+    for exc_type, reason in _EXC_MAP.items():
+        if isinstance(ex, exc_type):
+            return reason
+    return None
+
+
+# Type of the unexpected exception last logged with a traceback, per fetch that
+# is still failing
+_last_exc_type: dict[str, type[Exception]] = {}
+
+
+def _log_unexpected(ex: Exception, what: str) -> None:
+    """Log an unexpected failure to fetch what.
+
+    The traceback is only logged when the exception type differs from the last
+    one for the same fetch, so an outage doesn't log the same traceback on every
+    refresh. A fetch that fails again after succeeding logs it afresh.
+    """
+    if _last_exc_type.get(what) is type(ex):
+        _LOGGER.error("Unexpected exception fetching %s again: %s", what, ex)
+    else:
+        _last_exc_type[what] = type(ex)
+        _LOGGER.exception(
+            "Unexpected exception fetching %s: %s. Please open an issue", what, ex
+        )
+
+
+def _fetch_succeeded(what: str) -> None:
+    """Forget the failures of a fetch of what that has now succeeded."""
+    _last_exc_type.pop(what, None)
+
+
+def _log_fetch_error(ex: Exception, what: str) -> None:
+    """Log a failure to fetch what, with a traceback if it was unexpected."""
+    if (reason := _error_reason(ex)) is None:
+        _log_unexpected(ex, what)
+    else:
+        _LOGGER.error("%s fetching %s: %s", reason, what, ex)
+
+
+def _update_failed(ex: Exception, what: str) -> UpdateFailed:
+    """Return the UpdateFailed a coordinator raises for a failure to fetch what."""
+    if (reason := _error_reason(ex)) is None:
+        _log_unexpected(ex, what)
+        reason = "Unknown error"
+    return UpdateFailed(f"{reason} fetching {what}: {ex}")
+
+
+_SUPPLY_TYPES = {
+    ELEC_CONSUMPTION_CLASSIFIER: "electricity",
+    ELEC_COST_CLASSIFIER: "electricity",
+    GAS_CONSUMPTION_CLASSIFIER: "gas",
+    GAS_COST_CLASSIFIER: "gas",
+}
+
+# Resources that get Usage, Standing and Rate sensors
+_CONSUMPTION = frozenset({ELEC_CONSUMPTION_CLASSIFIER, GAS_CONSUMPTION_CLASSIFIER})
+# Cost resources, mapped to the consumption resource their sensor links to
+_COST_MAP = {
+    ELEC_COST_CLASSIFIER: ELEC_CONSUMPTION_CLASSIFIER,
+    GAS_COST_CLASSIFIER: GAS_CONSUMPTION_CLASSIFIER,
+}
+
+
+def _pence_to_gbp(pence: float) -> float:
+    """Return pence as pounds, shifting the decimal point exactly.
+
+    Dividing by 100 in binary floating point gives results like
+    0.15000000000000002, which then read as a change of state.
+    """
+    return float(Decimal(str(pence)).scaleb(-2))
+
+
+def _unique_resources(resources) -> list:
+    """Return resources without repeats of the same resource id."""
+    return list({resource.id: resource for resource in resources}.values())
+
 
 def supply_type(resource) -> str:
     """Return supply type."""
-    if "electricity.consumption" in resource.classifier:
-        return "electricity"
-    if "gas.consumption" in resource.classifier:
-        return "gas"
+    if (supply := _SUPPLY_TYPES.get(resource.classifier)) is not None:
+        return supply
     _LOGGER.error("Unknown classifier: %s. Please open an issue", resource.classifier)
     return "unknown"
 
@@ -137,136 +358,179 @@ def device_name(resource, virtual_entity) -> str:
     return name
 
 
-async def daily_data(hass: HomeAssistant, resource) -> float:
-    """Get Summ for the day from the API."""
-    _LOGGER.debug("Fetching today's data")
-    now = dt_util.utcnow()
-    utc_offset = -int(dt_util.now().utcoffset().total_seconds() / 60)
-    _LOGGER.debug("UTC offset is: %s", utc_offset)
+def meter_device_info(resource, virtual_entity) -> DeviceInfo:
+    """Return device information for the meter of a resource."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, resource.id)},
+        manufacturer="Hildebrand",
+        model="Glow (DCC)",
+        name=device_name(resource, virtual_entity),
+    )
 
-    try:
-        await hass.async_add_executor_job(resource.catchup)
-        _LOGGER.debug(
-            "Successful GET to https://api.glowmarkt.com/api/v0-1/resource/%s/catchup",
-            resource.id,
-        )
-    except HTTPError as ex:
-        _LOGGER.error("HTTP Error: %s, Status Code: %s", ex, ex.response.status_code)
-    except Timeout as ex:
-        _LOGGER.error("Timeout: %s", ex)
-    except ConnectionError as ex:
-        _LOGGER.error("Cannot connect: %s", ex)
-    except Exception as ex:  # pylint: disable=broad-except
-        _LOGGER.exception("Unexpected exception: %s. Please open an issue", ex)
-    t_from = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+
+@lru_cache(maxsize=1)
+def _daily_window(minute: datetime) -> tuple[datetime, datetime, int]:
+    """Return the readings window (t_from, t_to, utc_offset) for a UTC minute.
+
+    Cached so all coordinators refreshing in the same minute share one window.
+    """
+    utc_offset = _utc_offset(minute.replace(minute=0))
+    t_from = _day_start(minute.date(), minute.tzinfo, utc_offset)
+    return t_from, minute, utc_offset
+
+
+@lru_cache(maxsize=2)
+def _utc_offset(hour: datetime) -> int:
+    """Return minus the local UTC offset in minutes during a UTC hour.
+
+    DST changes fall on the hour, so the offset only needs working out when the
+    hour changes.
+    """
+    return -int(dt_util.as_local(hour).utcoffset().total_seconds() / 60)
+
+
+@lru_cache(maxsize=2)
+def _day_start(day: date, tz: tzinfo | None, utc_offset: int) -> datetime:
+    """Return midnight at the start of day, shifted by utc_offset minutes."""
+    return datetime(day.year, day.month, day.day, tzinfo=tz) + timedelta(
         minutes=utc_offset
     )
-    t_to = now.replace(second=0, microsecond=0)
+
+
+async def daily_data(
+    api: GlowmarktApi, resources: list, catchup: bool = True
+) -> dict[str, float | None]:
+    """Get today's totals for several resources, keyed by resource id."""
+    values = await asyncio.gather(
+        *(_resource_daily_data(api, r, catchup) for r in resources)
+    )
+    return {resource.id: value for resource, value in zip(resources, values)}
+
+
+async def _resource_daily_data(
+    api: GlowmarktApi, resource, catchup: bool = True
+) -> float | None:
+    """Get Summ for the day from the API, asking for a catchup first if set."""
+    _debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    now = dt_util.utcnow()
+    t_from, t_to, utc_offset = _daily_window(now.replace(second=0, microsecond=0))
+    if _debug:
+        _LOGGER.debug("Fetching today's data")
+        _LOGGER.debug("UTC offset is: %s", utc_offset)
+
+    if catchup:
+        try:
+            await api.async_catchup(resource.id)
+            _fetch_succeeded(f"catchup for {resource.classifier}")
+            if _debug:
+                _LOGGER.debug(
+                    "Successful GET to %sresource/%s/catchup",
+                    api.url,
+                    resource.id,
+                )
+        except Exception as ex:  # pylint: disable=broad-except
+            _log_fetch_error(ex, f"catchup for {resource.classifier}")
 
     try:
-        _LOGGER.debug(
-            "Get readings from %s to %s for %s when now= %s",
-            t_from,
-            t_to,
-            resource.classifier,
-            now,
-        )
-        readings = await hass.async_add_executor_job(
-            resource.get_readings, t_from, t_to, "P1D", "sum", utc_offset
-        )
-        _LOGGER.debug("Successfully got daily usage for resource id %s", resource.id)
-        _LOGGER.debug(
-            "Readings for %s has %s entries", resource.classifier, len(readings)
-        )
-        if not readings:
-            _LOGGER.debug("nothing returned")
-        else:
-            v = readings[0][1].value
+        if _debug:
             _LOGGER.debug(
-                "%s First reading %s at %s",
+                "Get readings from %s to %s for %s when now= %s",
+                t_from,
+                t_to,
                 resource.classifier,
-                readings[0][0],
-                readings[0][1].value,
+                now,
             )
-            if len(readings) > 1:
-                v += readings[1][1].value
-                _LOGGER.debug(
-                    "%s Second reading %s at %s",
-                    resource.classifier,
-                    readings[1][0],
-                    readings[1][1].value,
-                )
-            return v
-    except HTTPError as ex:
-        _LOGGER.error(
-            "HTTP Error fetching daily data: %s, Status Code: %s",
-            ex,
-            ex.response.status_code,
+        readings = await api.async_get_readings(
+            resource.id, t_from, t_to, "P1D", func="sum"
         )
+        _fetch_succeeded(f"daily data for {resource.classifier}")
+        if _debug:
+            _LOGGER.debug(
+                "Successfully got daily usage for resource id %s", resource.id
+            )
+            _LOGGER.debug(
+                "Readings for %s has %s entries", resource.classifier, len(readings)
+            )
+        if not readings:
+            _LOGGER.debug("nothing returned")
+        else:
+            if _debug:
+                for when, reading in readings:
+                    _LOGGER.debug(
+                        "%s Reading %s at %s", resource.classifier, reading.value, when
+                    )
+            # fsum is exact, so the same readings always give the same total
+            return math.fsum(reading.value for _, reading in readings)
+    except Exception as ex:  # pylint: disable=broad-except
+        _log_fetch_error(ex, f"daily data for {resource.classifier}")
         return None
-    except Timeout as ex:
-        _LOGGER.error("Timeout: %s", ex)
-        return None
-    except ConnectionError as ex:
-        _LOGGER.error("Cannot connect: %s", ex)
+
+
+# Resources the API returned no tariff for, with when that was found
+_no_tariff: dict[str, datetime] = {}
+
+
+async def tariff_data(api: GlowmarktApi, resource):
+    """Get tariff data from the API.
+
+    A resource with no tariff isn't asked about again for NO_TARIFF_RECHECK
+    hours; None is returned for it straight away. A failed fetch is logged and
+    raised, so it can't be mistaken for a resource without a tariff.
+    """
+    now = dt_util.utcnow()
+    found = _no_tariff.get(resource.id)
+    if found is not None and now - found < timedelta(hours=NO_TARIFF_RECHECK):
         return None
+    try:
+        tariff = await api.async_get_tariff(resource.id)
+        _fetch_succeeded(f"tariff data for {resource.classifier}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Successful GET to %sresource/%s/tariff",
+                api.url,
+                resource.id,
+            )
+        if tariff is None:
+            _no_tariff[resource.id] = now
+            supply = supply_type(resource)
+            _LOGGER.warning(
+                "No tariff data found for %s meter (id: %s). If you don't see tariff data for this meter in the Bright app, please disable the associated rate and standing charge sensors",
+                supply,
+                resource.id,
+            )
+        else:
+            _no_tariff.pop(resource.id, None)
+        return tariff
     except Exception as ex:
-        _LOGGER.exception("Unexpected exception: %s. Please open an issue", ex)
-        return None
+        _log_fetch_error(ex, f"tariff data for {resource.classifier}")
+        raise
 
 
-async def tariff_data(hass: HomeAssistant, resource):
-    """Get tariff data from the API."""
+async def _async_get_resources(api: GlowmarktApi, virtual_entity) -> list:
+    """Get the resources of a virtual entity, or an empty list on failure."""
     try:
-        tariff = await hass.async_add_executor_job(resource.get_tariff)
         _LOGGER.debug(
-            "Successful GET to https://api.glowmarkt.com/api/v0-1/resource/%s/tariff",
-            resource.id,
+            "Fetching resources for virtual entity %s...", virtual_entity.name
         )
-        return tariff
-    except UnboundLocalError:
-        supply = supply_type(resource)
-        _LOGGER.warning(
-            "No tariff data found for %s meter (id: %s). If you don't see tariff data for this meter in the Bright app, please disable the associated rate and standing charge sensors",
-            supply,
-            resource.id,
+        resources = await api.async_get_resources(virtual_entity.id)
+        _LOGGER.debug(
+            "Successful GET to %svirtualentity/%s/resources",
+            api.url,
+            virtual_entity.id,
         )
-        return None
-    except HTTPError as ex:
+        return resources
+    except ClientResponseError as ex:
         _LOGGER.error(
-            "HTTP Error fetching tariff data for %s: %s, Status Code: %s",
-            resource.classifier,
+            "HTTP Error fetching resources for %s: Status Code %s - %s",
+            virtual_entity.name,
+            ex.status,
             ex,
-            ex.response.status_code,
         )
-        return None
-    except Timeout as ex:
-        _LOGGER.error(
-            "Timeout fetching tariff data for %s: %s", resource.classifier, ex
-        )
-        return None
-    except ConnectionError as ex:
-        _LOGGER.error(
-            "Connection error fetching tariff data for %s: %s", resource.classifier, ex
-        )
-        return None
+    except (TimeoutError, ClientError) as ex:
+        _LOGGER.error("Failed to get resources: %s", ex)
     except Exception as ex:
-        _LOGGER.exception(
-            "Unexpected exception fetching tariff data for %s: %s. Please open an issue",
-            resource.classifier,
-            ex,
-        )
-        return None
-
-
-async def _delayed_first_refresh(coordinator: DataUpdateCoordinator, delay: int = 5):
-    """Perform first refresh after a delay."""
-    _LOGGER.debug(
-        "Scheduling delayed first refresh for %s in %d seconds", coordinator.name, delay
-    )
-    await asyncio.sleep(delay)
-    await coordinator.async_request_refresh()
-    _LOGGER.debug("Completed delayed first refresh for %s", coordinator.name)
+        _LOGGER.exception("Unexpected exception: %s. Please open an issue", ex)
+    return []
 
 
 # --- SENSOR BASE CLASS ---
@@ -275,33 +539,47 @@ async def _delayed_first_refresh(coordinator: DataUpdateCoordinator, delay: int
 class GlowDCCSensor(CoordinatorEntity, SensorEntity, ABC):
     """Base class for Hildebrand Glow DCC sensors."""
 
+    __slots__ = ("resource", "virtual_entity", "_last_written")
+
     def __init__(
-        self, coordinator: DataUpdateCoordinator, resource, virtual_entity
+        self,
+        coordinator: DataUpdateCoordinator,
+        resource,
+        virtual_entity,
+        device_resource=None,
     ) -> None:
         super().__init__(coordinator)
         self.resource = resource
         self.virtual_entity = virtual_entity
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        identifier_resource = self.resource
-        if hasattr(self, "meter") and self.meter is not None:
-            identifier_resource = self.meter.resource
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, identifier_resource.id)},
-            manufacturer="Hildebrand",
-            model="Glow (DCC)",
-            name=device_name(identifier_resource, self.virtual_entity),
+        self._attr_device_info = meter_device_info(
+            device_resource or resource, virtual_entity
         )
+        self._last_written = None
+
+    def _resource_data(self):
+        """Return this sensor's entry in the coordinator data, if any."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get(self.resource.id)
+
+    async def async_added_to_hass(self) -> None:
+        """Seed the state from the coordinator's first refresh."""
+        await super().async_added_to_hass()
+        if (data := self._resource_data()) is not None:
+            self._update_native_value(data)
+        self._last_written = (self._attr_native_value, self.available)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data is not None:
-            self._update_native_value(self.coordinator.data)
-        self.async_write_ha_state()
+        if (data := self._resource_data()) is not None:
+            self._update_native_value(data)
+        # Most refreshes bring no new reading, so only write the state when it
+        # has changed
+        written = (self._attr_native_value, self.available)
+        if written != self._last_written:
+            self._last_written = written
+            self.async_write_ha_state()
 
     @abstractmethod
     def _update_native_value(self, data):
@@ -309,17 +587,31 @@ class GlowDCCSensor(CoordinatorEntity, SensorEntity, ABC):
         pass
 
 
+class GlowTariffSensor(GlowDCCSensor):
+    """Base class for sensors showing part of a resource's current tariff."""
+
+    __slots__ = ()
+
+    @property
+    def available(self) -> bool:
+        """Return False while the coordinator has no tariff for this resource."""
+        return super().available and self._resource_data() is not None
+
+
 # --- SENSOR CLASSES ---
 
 
 class Usage(GlowDCCSensor):
     """Sensor object for daily usage."""
 
+    __slots__ = ()
+
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_has_entity_name = True
     _attr_name = "Usage (today)"
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_suggested_display_precision = 2
 
     def __init__(
         self, coordinator: DataUpdateCoordinator, resource, virtual_entity
@@ -327,91 +619,76 @@ class Usage(GlowDCCSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, resource, virtual_entity)
         self._attr_unique_id = f"{resource.id}_usage_today"
+        if resource.classifier == GAS_CONSUMPTION_CLASSIFIER:
+            self._attr_icon = "mdi:fire"
         _LOGGER.debug("Created Usage sensor with unique_id: %s", self._attr_unique_id)
 
-    @property
-    def icon(self) -> str | None:
-        """Icon to use in the frontend."""
-        if self.resource.classifier == "gas.consumption":
-            return "mdi:fire"
-        return None
-
     @callback
     def _update_native_value(self, data: float) -> None:
         """Set the native value for usage sensor from coordinator data."""
-        self._attr_native_value = round(data, 2)
+        self._attr_native_value = data
 
 
 class Cost(GlowDCCSensor):
     """Sensor usage for daily cost."""
 
+    __slots__ = ()
+
     _attr_device_class = SensorDeviceClass.MONETARY
     _attr_has_entity_name = True
     _attr_name = "Cost (today)"
     _attr_native_unit_of_measurement = "GBP"
     _attr_state_class = SensorStateClass.TOTAL
+    _attr_suggested_display_precision = 2
 
     def __init__(
-        self, coordinator: DataUpdateCoordinator, resource, virtual_entity
+        self, coordinator: DataUpdateCoordinator, resource, virtual_entity, meter
     ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, resource, virtual_entity)
-        self.meter = None
+        """Initialize the sensor, grouped with the device of its usage meter."""
+        super().__init__(coordinator, resource, virtual_entity, meter.resource)
         self._attr_unique_id = f"{resource.id}_cost_today"
         _LOGGER.debug("Created Cost sensor with unique_id: %s", self._attr_unique_id)
 
     @callback
     def _update_native_value(self, data: float) -> None:
         """Set the native value for cost sensor from coordinator data."""
-        self._attr_native_value = round(data / 100, 2)
+        self._attr_native_value = _pence_to_gbp(data)
 
 
-class Standing(CoordinatorEntity, SensorEntity):
-    """An entity using CoordinatorEntity."""
+class Standing(GlowTariffSensor):
+    """Sensor for the standing charge of the current tariff."""
+
+    __slots__ = ()
 
     _attr_device_class = SensorDeviceClass.MONETARY
     _attr_has_entity_name = True
     _attr_name = "Standing charge"
     _attr_native_unit_of_measurement = "GBP"
     _attr_entity_registry_enabled_default = False
+    _attr_suggested_display_precision = 4
 
     def __init__(
         self, coordinator: DataUpdateCoordinator, resource, virtual_entity
     ) -> None:
-        """Pass coordinator to CoordinatorEntity."""
-        super().__init__(coordinator)
-
+        """Initialize the sensor."""
+        super().__init__(coordinator, resource, virtual_entity)
         self._attr_unique_id = f"{resource.id}_standing_charge"
         _LOGGER.debug(
             "Created Standing sensor with unique_id: %s", self._attr_unique_id
         )
 
-        self.resource = resource
-        self.virtual_entity = virtual_entity
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data:
-            value = (
-                float(self.coordinator.data.current_rates.standing_charge.value) / 100
-            )
-            self._attr_native_value = round(value, 4)
-            self.async_write_ha_state()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.resource.id)},
-            manufacturer="Hildebrand",
-            model="Glow (DCC)",
-            name=device_name(self.resource, self.virtual_entity),
+    def _update_native_value(self, data) -> None:
+        """Set the native value for standing charge sensor from tariff data."""
+        self._attr_native_value = _pence_to_gbp(
+            data.current_rates.standing_charge.value
         )
 
 
-class Rate(CoordinatorEntity, SensorEntity):
-    """An entity using CoordinatorEntity."""
+class Rate(GlowTariffSensor):
+    """Sensor for the unit rate of the current tariff."""
+
+    __slots__ = ()
 
     _attr_device_class = None
     _attr_has_entity_name = True
@@ -419,36 +696,20 @@ class Rate(CoordinatorEntity, SensorEntity):
     _attr_name = "Rate"
     _attr_native_unit_of_measurement = "GBP/kWh"
     _attr_entity_registry_enabled_default = False
+    _attr_suggested_display_precision = 4
 
     def __init__(
         self, coordinator: DataUpdateCoordinator, resource, virtual_entity
     ) -> None:
-        """Pass coordinator to CoordinatorEntity."""
-        super().__init__(coordinator)
-
+        """Initialize the sensor."""
+        super().__init__(coordinator, resource, virtual_entity)
         self._attr_unique_id = f"{resource.id}_rate"
         _LOGGER.debug("Created Rate sensor with unique_id: %s", self._attr_unique_id)
 
-        self.resource = resource
-        self.virtual_entity = virtual_entity
-
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data:
-            value = float(self.coordinator.data.current_rates.rate.value) / 100
-            self._attr_native_value = round(value, 4)
-            self.async_write_ha_state()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.resource.id)},
-            manufacturer="Hildebrand",
-            model="Glow (DCC)",
-            name=device_name(self.resource, self.virtual_entity),
-        )
+    def _update_native_value(self, data) -> None:
+        """Set the native value for rate sensor from tariff data."""
+        self._attr_native_value = _pence_to_gbp(data.current_rates.rate.value)
 
 
 # --- ASYNC SETUP ENTRY FUNCTION ---
@@ -458,153 +719,131 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: Callable
 ) -> bool:
     """Set up the sensor platform."""
-    _LOGGER.debug("Starting async_setup_entry in sensor platform.")
+    _debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    if _debug:
+        _LOGGER.debug("Starting async_setup_entry in sensor platform.")
     entities: list = []
-    meters: dict = {}
-    daily_coordinators: dict[str, DataCoordinator] = {}
-    tariff_coordinators: dict[str, TariffCoordinator] = {}
 
-    glowmarkt = hass.data[DOMAIN][entry.entry_id]["client"]
-    # Get the daily and tariff intervals from the stored data, with a fallback default.
-    daily_interval = hass.data[DOMAIN][entry.entry_id].get(CONF_DAILY_INTERVAL, 15)
-    tariff_interval = hass.data[DOMAIN][entry.entry_id].get(CONF_TARIFF_INTERVAL, 60)
+    runtime: GlowRuntime = hass.data[DOMAIN][entry.entry_id]
+    api = runtime.api
+    daily_interval = runtime.daily_interval
+    tariff_interval = runtime.tariff_interval
 
     virtual_entities: dict = {}
     try:
-        _LOGGER.debug("Fetching virtual entities from API...")
-        virtual_entities = await hass.async_add_executor_job(
-            glowmarkt.get_virtual_entities
-        )
-        _LOGGER.debug("Successful GET to %svirtualentity", glowmarkt.url)
-    except HTTPError as ex:
+        if _debug:
+            _LOGGER.debug("Fetching virtual entities from API...")
+        virtual_entities = await api.async_get_virtual_entities()
+        if _debug:
+            _LOGGER.debug("Successful GET to %svirtualentity", api.url)
+    except ClientResponseError as ex:
         _LOGGER.error(
             "HTTP Error fetching virtual entities: Status Code %s - %s",
-            ex.response.status_code,
+            ex.status,
             ex,
         )
         return False
-    except (Timeout, ConnectionError) as ex:
+    except (TimeoutError, ClientError) as ex:
         _LOGGER.error("Failed to get virtual entities: %s", ex)
         return False
     except Exception as ex:
         _LOGGER.exception("Unexpected exception: %s. Please open an issue", ex)
         return False
 
-    for virtual_entity in virtual_entities:
-        _LOGGER.debug("Found virtual entity: %s", virtual_entity.name)
-        resources: dict = {}
-        try:
-            _LOGGER.debug(
-                "Fetching resources for virtual entity %s...", virtual_entity.name
-            )
-            resources = await hass.async_add_executor_job(virtual_entity.get_resources)
-            _LOGGER.debug(
-                "Successful GET to %svirtualentity/%s/resources",
-                glowmarkt.url,
-                virtual_entity.id,
-            )
-        except HTTPError as ex:
-            _LOGGER.error(
-                "HTTP Error fetching resources for %s: Status Code %s - %s",
-                virtual_entity.name,
-                ex.response.status_code,
-                ex,
-            )
-            continue
-        except (Timeout, ConnectionError) as ex:
-            _LOGGER.error("Failed to get resources: %s", ex)
-            continue
-        except Exception as ex:
-            _LOGGER.exception("Unexpected exception: %s. Please open an issue", ex)
-            continue
+    # Fetch the resources of every virtual entity concurrently
+    resource_lists = await asyncio.gather(
+        *(_async_get_resources(api, ve) for ve in virtual_entities)
+    )
 
+    # One coordinator polls the daily totals of every resource on the account and
+    # one polls every tariff, so the API sees one burst of requests per interval
+    all_resources = [r for resources in resource_lists for r in resources]
+    daily_coordinator = DataCoordinator(
+        hass,
+        api,
+        _unique_resources(
+            r
+            for r in all_resources
+            if r.classifier in _CONSUMPTION or r.classifier in _COST_MAP
+        ),
+        daily_interval,
+        entry.entry_id,
+    )
+    tariff_coordinator = TariffCoordinator(
+        hass,
+        api,
+        _unique_resources(r for r in all_resources if r.classifier in _CONSUMPTION),
+        tariff_interval,
+        entry.entry_id,
+    )
+    await asyncio.gather(
+        daily_coordinator.async_load_cache(), tariff_coordinator.async_load_cache()
+    )
+    entry.async_on_unload(daily_coordinator.async_flush_cache)
+
+    for virtual_entity, resources in zip(virtual_entities, resource_lists):
+        if _debug:
+            _LOGGER.debug("Found virtual entity: %s", virtual_entity.name)
+        # Cost sensors link to their Usage sensor, so they are built once every
+        # consumption resource of this virtual entity has been seen
+        meters: dict = {}
+        deferred_costs: list[tuple] = []
         for resource in resources:
-            _LOGGER.debug(
-                "Processing resource with classifier: %s", resource.classifier
-            )
-            if resource.classifier in ["electricity.consumption", "gas.consumption"]:
-                coordinator_key = f"{virtual_entity.id}_{resource.classifier}"
-                if coordinator_key not in daily_coordinators:
-                    daily_coordinators[coordinator_key] = DataCoordinator(
-                        hass, resource, daily_interval
-                    )
-                    # Schedule delayed first refresh instead of immediate call
-                    hass.async_create_task(
-                        _delayed_first_refresh(daily_coordinators[coordinator_key], 5)
-                    )
-
-                usage_sensor = Usage(
-                    daily_coordinators[coordinator_key], resource, virtual_entity
-                )
+            classifier = resource.classifier
+            if _debug:
+                _LOGGER.debug("Processing resource with classifier: %s", classifier)
+            if classifier in _CONSUMPTION:
+                usage_sensor = Usage(daily_coordinator, resource, virtual_entity)
                 entities.append(usage_sensor)
                 meters[resource.classifier] = usage_sensor
-                _LOGGER.debug(
-                    "Added Usage sensor to list for entity %s", resource.classifier
-                )
-
-                if coordinator_key not in tariff_coordinators:
-                    tariff_coordinators[coordinator_key] = TariffCoordinator(
-                        hass, resource, tariff_interval
-                    )
-                    # Schedule delayed first refresh instead of immediate call
-                    hass.async_create_task(
-                        _delayed_first_refresh(tariff_coordinators[coordinator_key], 5)
+                if _debug:
+                    _LOGGER.debug(
+                        "Added Usage sensor to list for entity %s", classifier
                     )
 
-                standing_sensor = Standing(
-                    tariff_coordinators[coordinator_key], resource, virtual_entity
-                )
+                standing_sensor = Standing(tariff_coordinator, resource, virtual_entity)
                 entities.append(standing_sensor)
-                _LOGGER.debug(
-                    "Added Standing sensor to list for entity %s", resource.classifier
-                )
-
-                rate_sensor = Rate(
-                    tariff_coordinators[coordinator_key], resource, virtual_entity
-                )
-                entities.append(rate_sensor)
-                _LOGGER.debug(
-                    "Added Rate sensor to list for entity %s", resource.classifier
-                )
-
-        for resource in resources:
-            if resource.classifier == "gas.consumption.cost":
-                coordinator_key = f"{virtual_entity.id}_{resource.classifier}"
-                if coordinator_key not in daily_coordinators:
-                    daily_coordinators[coordinator_key] = DataCoordinator(
-                        hass, resource, daily_interval
-                    )
-                    # Schedule delayed first refresh instead of immediate call
-                    hass.async_create_task(
-                        _delayed_first_refresh(daily_coordinators[coordinator_key], 5)
+                if _debug:
+                    _LOGGER.debug(
+                        "Added Standing sensor to list for entity %s", classifier
                     )
 
-                cost_sensor = Cost(
-                    daily_coordinators[coordinator_key], resource, virtual_entity
-                )
-                cost_sensor.meter = meters["gas.consumption"]
-                entities.append(cost_sensor)
-                _LOGGER.debug("Added Gas Cost sensor to list.")
-            elif resource.classifier == "electricity.consumption.cost":
-                coordinator_key = f"{virtual_entity.id}_{resource.classifier}"
-                if coordinator_key not in daily_coordinators:
-                    daily_coordinators[coordinator_key] = DataCoordinator(
-                        hass, resource, daily_interval
-                    )
-                    # Schedule delayed first refresh instead of immediate call
-                    hass.async_create_task(
-                        _delayed_first_refresh(daily_coordinators[coordinator_key], 5)
-                    )
-
-                cost_sensor = Cost(
-                    daily_coordinators[coordinator_key], resource, virtual_entity
+                rate_sensor = Rate(tariff_coordinator, resource, virtual_entity)
+                entities.append(rate_sensor)
+                if _debug:
+                    _LOGGER.debug("Added Rate sensor to list for entity %s", classifier)
+            elif meter_key := _COST_MAP.get(classifier):
+                deferred_costs.append((resource, meter_key))
+
+        for resource, meter_key in deferred_costs:
+            if (meter := meters.get(meter_key)) is None:
+                _LOGGER.warning(
+                    "Skipping %s cost sensor for %s, it has no %s resource",
+                    resource.classifier,
+                    virtual_entity.name,
+                    meter_key,
                 )
-                cost_sensor.meter = meters["electricity.consumption"]
-                entities.append(cost_sensor)
-                _LOGGER.debug("Added Electricity Cost sensor to list.")
+                continue
+            cost_sensor = Cost(daily_coordinator, resource, virtual_entity, meter)
+            entities.append(cost_sensor)
+            if _debug:
+                _LOGGER.debug("Added Cost sensor to list for entity %s", meter_key)
+
+    # Fetch the first data for both coordinators at once, so entities start out
+    # with a value instead of waiting for a refresh after they are added
+    await asyncio.gather(
+        *(
+            c.async_refresh()
+            for c in (daily_coordinator, tariff_coordinator)
+            if c.resources
+        )
+    )
 
-    _LOGGER.debug("Calling async_add_entities with %s entities", len(entities))
-    async_add_entities(entities)
-    _LOGGER.debug("async_add_entities call completed.")
+    if _debug:
+        _LOGGER.debug("Calling async_add_entities with %s entities", len(entities))
+    # The coordinators have already refreshed, so the entities have their data
+    async_add_entities(entities, update_before_add=False)
+    if _debug:
+        _LOGGER.debug("async_add_entities call completed.")
 
     return True